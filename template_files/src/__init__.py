@@ -3,4 +3,72 @@
 # Description: Makes src a Python module
 # -----------------------------------------------------------------------------
 
-# This file enables Python to treat the src directory as a package.
+"""
+Public API of the project package, loaded lazily.
+
+Submodules (and the heavy libraries they import, such as pandas, numpy,
+matplotlib or scikit-learn) are only imported the first time one of their
+names is accessed, so importing `src` itself stays cheap for short CLI jobs.
+See PEP 562 for the module-level `__getattr__` mechanism.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from . import config, dataset, features, modeling, plots
+    from .dataset import load_data
+    from .features import build_features
+    from .modeling import predict, train_model
+    from .plots import plot_distribution
+
+# Public name -> (relative module, attribute or None for the module itself)
+_LAZY_ATTRS: Final[dict[str, tuple[str, str | None]]] = {
+    # Submodules
+    "config": (".config", None),
+    "dataset": (".dataset", None),
+    "features": (".features", None),
+    "modeling": (".modeling", None),
+    "plots": (".plots", None),
+    # Functions
+    "load_data": (".dataset", "load_data"),
+    "build_features": (".features", "build_features"),
+    "plot_distribution": (".plots", "plot_distribution"),
+    "train_model": (".modeling", "train_model"),
+    "predict": (".modeling", "predict"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing `name` on first access and cache it."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
+
+__all__: Final[tuple[str, ...]] = (
+    # Submodules
+    "config",
+    "dataset",
+    "features",
+    "modeling",
+    "plots",
+    # Functions
+    "load_data",
+    "build_features",
+    "plot_distribution",
+    "train_model",
+    "predict",
+)
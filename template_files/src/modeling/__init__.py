@@ -3,4 +3,55 @@
 # Description: Makes modeling a submodule of src
 # -----------------------------------------------------------------------------
 
-# This file enables Python to treat src.modeling as a package.
+"""
+Training, inference and model storage.
+
+`train_model` and `predict` are bound eagerly: their modules only import
+the standard library, and binding them here keeps the package attribute
+from being replaced by the `modeling.predict` submodule once that is
+imported. The registry, which needs numpy, is loaded lazily on first
+access (PEP 562).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+from .predict import predict
+from .train import train_model
+
+if TYPE_CHECKING:
+    from .registry import ModelRecord, ModelRegistry, hash_data
+
+# Public name -> relative module defining it
+_LAZY_ATTRS: Final[dict[str, str]] = {
+    "ModelRegistry": ".registry",
+    "ModelRecord": ".registry",
+    "hash_data": ".registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing `name` on first access and cache it."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
+
+__all__: Final[tuple[str, ...]] = (
+    "train_model",
+    "predict",
+    "ModelRegistry",
+    "ModelRecord",
+    "hash_data",
+)
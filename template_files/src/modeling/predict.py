@@ -10,7 +10,22 @@ Generate predictions using trained models.
 from typing import Any
 
 
-def predict(input_data: Any) -> Any:
+def predict(input_data: Any, dataset: str = "default") -> Any:
     print("Generating predictions...")
+    # Deferred so importing this module does not load numpy
+    from .registry import ModelRegistry
+
+    registry = ModelRegistry()
+    record = registry.latest(dataset)
+    if record is None:
+        print(f"No trained model registered for dataset {dataset!r}.")
+        return None
+    if record.kind != "pickle":
+        raise TypeError(
+            f"Latest model for {dataset!r} is stored as raw arrays "
+            f"({record.kind}); implement prediction from its weights."
+        )
+
+    model = registry.load(record)
     # TODO: Implement prediction logic
-    return None
+    return model.predict(input_data)
@@ -0,0 +1,525 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/src/modeling/registry.py
+# Description: Content-addressed model artifact store with a SQLite index
+# -----------------------------------------------------------------------------
+
+"""
+Content-addressed storage for trained models under `models/`.
+
+Artifacts are stored once per content hash, so saving an identical model
+from two experiments writes a single file. Each save is recorded in a small
+SQLite index together with its dataset, parameters, data hash and metrics,
+and a per-dataset pointer makes "latest model for dataset X" a single
+primary-key lookup.
+
+NumPy arrays (or mappings of named arrays, e.g. weight matrices) are stored
+as `.npy` files and loaded with memory-mapping, so only the pages that are
+actually read are pulled from disk. Any other object is pickled.
+
+Deduplication of pickled objects is best-effort. Their hash is taken over
+the pickle stream, which is not canonical: set and dict ordering (string
+hashing is randomized per process) or memoization can give equal objects
+different bytes, in which case each copy is stored. Arrays are hashed by
+dtype, shape and buffer and always deduplicate.
+
+Layout:
+    models/
+    ├── registry.sqlite
+    └── objects/
+        └── ab/
+            ├── ab12....pkl           <- pickled estimator
+            └── ab34..../             <- mapping of named arrays
+                ├── coef.npy
+                └── intercept.npy
+
+The default root is `MODELS_DIR` from `shared.paths`. It resolves both when
+`src/` is on `sys.path` (`import modeling`, the installed layout) and when
+the project root is (`import src.modeling`). Pass `root` explicitly for any
+other layout. Nothing is created on disk until the first `save()`.
+
+Usage:
+    >>> from modeling.registry import ModelRegistry
+    >>> registry = ModelRegistry()
+    >>> record = registry.save(model, dataset="sales", params={"depth": 6},
+    ...                        data=train_df, metrics={"rmse": 0.42})
+    >>> model = registry.load_latest("sales")
+"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import re
+import shutil
+import sqlite3
+import tempfile
+from typing import Any, Final, Literal
+
+import numpy as np
+
+# -----------------------------------------------
+# Defaults
+# -----------------------------------------------
+INDEX_FILENAME: Final[str] = "registry.sqlite"
+OBJECTS_DIRNAME: Final[str] = "objects"
+# Keys of array mappings become file names, so they must be path-safe
+ARRAY_KEY_RE: Final[re.Pattern[str]] = re.compile(r"[A-Za-z0-9_][\w.-]*")
+
+ArtifactKind = Literal["npy", "npy_dir", "pickle"]
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    hash        TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    created_at  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS models (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    dataset     TEXT NOT NULL,
+    hash        TEXT NOT NULL REFERENCES artifacts(hash),
+    params      TEXT NOT NULL,
+    data_hash   TEXT,
+    metrics     TEXT NOT NULL,
+    created_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS models_dataset_idx ON models(dataset, id);
+CREATE TABLE IF NOT EXISTS latest (
+    dataset     TEXT PRIMARY KEY,
+    model_id    INTEGER NOT NULL REFERENCES models(id)
+);
+"""
+
+
+# -----------------------------------------------
+# Records
+# -----------------------------------------------
+@dataclass(frozen=True, slots=True)
+class ModelRecord:
+    """
+    A registered model and the artifact it points to.
+
+    Attributes:
+        id: Row id of the registration.
+        dataset: Dataset the model was trained on.
+        hash: Content hash of the artifact.
+        kind: Storage format of the artifact.
+        path: Artifact location, relative to the registry root.
+        params: Training parameters.
+        data_hash: Hash of the training data, if provided.
+        metrics: Evaluation metrics.
+        created_at: ISO 8601 registration timestamp (UTC).
+    """
+
+    id: int
+    dataset: str
+    hash: str
+    kind: ArtifactKind
+    path: str
+    params: dict[str, Any]
+    data_hash: str | None
+    metrics: dict[str, Any]
+    created_at: str
+
+
+# -----------------------------------------------
+# Hashing Helpers
+# -----------------------------------------------
+def _update_with_array(digest: Any, array: np.ndarray) -> None:
+    array = np.ascontiguousarray(array)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(array.data)
+
+
+def hash_data(data: Any) -> str:
+    """
+    Compute a stable SHA-256 hash of training data.
+
+    DataFrames and Series are hashed row by row with
+    `pandas.util.hash_pandas_object`, arrays by dtype, shape and buffer,
+    and anything else by its pickle.
+
+    Args:
+        data: Training data.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    if isinstance(data, np.ndarray):
+        _update_with_array(digest, data)
+        return digest.hexdigest()
+
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None and isinstance(data, pd.DataFrame | pd.Series):
+        digest.update(repr(list(getattr(data, "columns", []))).encode())
+        _update_with_array(
+            digest, pd.util.hash_pandas_object(data, index=True).to_numpy()
+        )
+        return digest.hexdigest()
+
+    digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return digest.hexdigest()
+
+
+def _artifact_kind(artifact: Any) -> ArtifactKind:
+    """
+    Choose the storage format of an artifact.
+
+    Raises:
+        ValueError: If a mapping of arrays has a key that is not a safe
+            file name.
+    """
+    if isinstance(artifact, np.ndarray) and artifact.dtype != object:
+        return "npy"
+    if (
+        isinstance(artifact, Mapping)
+        and artifact
+        and all(
+            isinstance(key, str)
+            and isinstance(value, np.ndarray)
+            and value.dtype != object
+            for key, value in artifact.items()
+        )
+    ):
+        invalid = [k for k in artifact if not ARRAY_KEY_RE.fullmatch(k)]
+        if invalid:
+            raise ValueError(
+                f"Array names must match {ARRAY_KEY_RE.pattern!r}: {invalid}"
+            )
+        return "npy_dir"
+    return "pickle"
+
+
+def _array_artifact_hash(artifact: Any, kind: ArtifactKind) -> str:
+    digest = hashlib.sha256(kind.encode())
+    if kind == "npy":
+        _update_with_array(digest, artifact)
+    else:
+        for key in sorted(artifact):
+            digest.update(key.encode() + b"\0")
+            _update_with_array(digest, artifact[key])
+    return digest.hexdigest()
+
+
+class _HashingWriter:
+    """File wrapper that hashes everything written through it."""
+
+    __slots__ = ("_file", "digest")
+
+    def __init__(self, file: Any, digest: Any) -> None:
+        self._file = file
+        self.digest = digest
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        return self._file.write(data)
+
+
+# -----------------------------------------------
+# Registry
+# -----------------------------------------------
+class ModelRegistry:
+    """
+    Content-addressed model store backed by a SQLite index.
+
+    Args:
+        root: Registry directory. Defaults to `MODELS_DIR`.
+    """
+
+    _SELECT: Final[str] = (
+        "SELECT m.id, m.dataset, m.hash, a.kind, a.path, m.params, "
+        "m.data_hash, m.metrics, m.created_at "
+        "FROM models m JOIN artifacts a ON a.hash = m.hash "
+    )
+
+    def __init__(self, root: str | Path | None = None) -> None:
+        if root is None:
+            try:
+                from shared.paths import MODELS_DIR
+            except ImportError:
+                # Imported as `src.modeling` with only the project root on
+                # sys.path
+                from ..shared.paths import MODELS_DIR
+
+            root = MODELS_DIR
+
+        self.root: Path = Path(root)
+        self.objects_dir: Path = self.root / OBJECTS_DIRNAME
+        self.index_path: Path = self.root / INDEX_FILENAME
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, commit on success and always close."""
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                yield conn
+
+    def _ensure_index(self) -> None:
+        """Create the object store and index schema on first write."""
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    # ---- Writing ----
+    def _object_path(self, digest: str, kind: ArtifactKind) -> Path:
+        suffix = {"npy": ".npy", "npy_dir": "", "pickle": ".pkl"}[kind]
+        return self.objects_dir / digest[:2] / f"{digest}{suffix}"
+
+    def _write_artifact(
+        self, artifact: Any, kind: ArtifactKind
+    ) -> tuple[str, Path]:
+        """
+        Write an artifact atomically unless it is already stored.
+
+        Arrays are hashed up front, so a stored copy is found without
+        writing anything. Pickles are hashed while being streamed to a
+        staging file, which is then renamed to its digest path; the object
+        is serialized once and never held in memory as bytes.
+
+        Returns:
+            The content hash and the stored artifact path.
+        """
+        if kind != "pickle":
+            digest = _array_artifact_hash(artifact, kind)
+            target = self._object_path(digest, kind)
+            if target.exists():
+                return digest, target
+
+        staging = Path(tempfile.mkdtemp(dir=self.objects_dir, prefix=".tmp-"))
+        try:
+            if kind == "npy":
+                staged = staging / "artifact.npy"
+                np.save(staged, artifact, allow_pickle=False)
+            elif kind == "npy_dir":
+                staged = staging / "artifact"
+                staged.mkdir()
+                for key, value in artifact.items():
+                    np.save(staged / f"{key}.npy", value, allow_pickle=False)
+            else:
+                staged = staging / "artifact.pkl"
+                with staged.open("wb") as f:
+                    writer = _HashingWriter(f, hashlib.sha256(kind.encode()))
+                    pickle.dump(
+                        artifact, writer, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                digest = writer.digest.hexdigest()
+                target = self._object_path(digest, kind)
+
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.replace(staged, target)
+                except OSError:
+                    # Another process stored the same content first.
+                    if not target.exists():
+                        raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return digest, target
+
+    def save(
+        self,
+        artifact: Any,
+        dataset: str,
+        params: Mapping[str, Any] | None = None,
+        data: Any = None,
+        data_hash: str | None = None,
+        metrics: Mapping[str, Any] | None = None,
+    ) -> ModelRecord:
+        """
+        Store an artifact and register it as the latest model for `dataset`.
+
+        Identical artifacts are written only once; registering the same
+        content again only adds an index row. For pickled objects this is
+        best-effort, since equal objects do not always pickle to the same
+        bytes.
+
+        Args:
+            artifact: Model object, NumPy array or mapping of named arrays.
+            dataset: Dataset name the model was trained on.
+            params: Training parameters (must be JSON-serializable).
+            data: Training data to hash. Ignored if `data_hash` is given.
+            data_hash: Precomputed hash of the training data.
+            metrics: Evaluation metrics (must be JSON-serializable).
+
+        Returns:
+            The new registration.
+
+        Raises:
+            ValueError: If a mapping of arrays has an unsafe array name.
+        """
+        kind = _artifact_kind(artifact)
+        self._ensure_index()
+        digest, target = self._write_artifact(artifact, kind)
+        if data_hash is None and data is not None:
+            data_hash = hash_data(data)
+
+        size = (
+            sum(p.stat().st_size for p in target.iterdir())
+            if target.is_dir()
+            else target.stat().st_size
+        )
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    kind,
+                    target.relative_to(self.root).as_posix(),
+                    size,
+                    created_at,
+                ),
+            )
+            cursor = conn.execute(
+                "INSERT INTO models "
+                "(dataset, hash, params, data_hash, metrics, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    dataset,
+                    digest,
+                    json.dumps(dict(params or {}), sort_keys=True),
+                    data_hash,
+                    json.dumps(dict(metrics or {}), sort_keys=True),
+                    created_at,
+                ),
+            )
+            model_id = cursor.lastrowid
+            conn.execute(
+                "INSERT OR REPLACE INTO latest VALUES (?, ?)",
+                (dataset, model_id),
+            )
+
+        return self.get(model_id)
+
+    # ---- Lookup ----
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> ModelRecord:
+        return ModelRecord(
+            id=row["id"],
+            dataset=row["dataset"],
+            hash=row["hash"],
+            kind=row["kind"],
+            path=row["path"],
+            params=json.loads(row["params"]),
+            data_hash=row["data_hash"],
+            metrics=json.loads(row["metrics"]),
+            created_at=row["created_at"],
+        )
+
+    def get(self, model_id: int | None) -> ModelRecord:
+        """
+        Fetch a registration by id.
+
+        Raises:
+            KeyError: If no model with that id exists.
+        """
+        if not self.index_path.exists():
+            raise KeyError(f"No model with id {model_id}")
+        with self._connect() as conn:
+            row = conn.execute(
+                self._SELECT + "WHERE m.id = ?", (model_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No model with id {model_id}")
+        return self._to_record(row)
+
+    def latest(self, dataset: str) -> ModelRecord | None:
+        """
+        Return the most recently saved model for a dataset, if any.
+
+        Args:
+            dataset: Dataset name.
+
+        Returns:
+            The latest registration, or None if nothing was saved yet.
+        """
+        if not self.index_path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                self._SELECT + "JOIN latest l ON l.model_id = m.id "
+                "WHERE l.dataset = ?",
+                (dataset,),
+            ).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    def history(self, dataset: str) -> list[ModelRecord]:
+        """
+        List every registration for a dataset, newest first.
+
+        Args:
+            dataset: Dataset name.
+        """
+        if not self.index_path.exists():
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                self._SELECT + "WHERE m.dataset = ? ORDER BY m.id DESC",
+                (dataset,),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    # ---- Loading ----
+    def load(self, record: ModelRecord, mmap: bool = True) -> Any:
+        """
+        Load the artifact of a registration.
+
+        Args:
+            record: Registration to load.
+            mmap: Memory-map `.npy` arrays read-only instead of reading
+                them fully into memory. Ignored for pickled artifacts.
+
+        Returns:
+            The stored object. Arrays are `np.memmap`-backed when `mmap`
+            is True.
+        """
+        path = self.root / record.path
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+
+        if record.kind == "npy":
+            return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+        if record.kind == "npy_dir":
+            return {
+                array_path.stem: np.load(
+                    array_path, mmap_mode=mmap_mode, allow_pickle=False
+                )
+                for array_path in sorted(path.glob("*.npy"))
+            }
+        with path.open("rb") as f:
+            return pickle.load(f)
+
+    def load_latest(self, dataset: str, mmap: bool = True) -> Any:
+        """
+        Load the most recently saved model for a dataset.
+
+        Raises:
+            KeyError: If no model was saved for the dataset.
+        """
+        record = self.latest(dataset)
+        if record is None:
+            raise KeyError(f"No model registered for dataset {dataset!r}")
+        return self.load(record, mmap=mmap)
+
+
+# -----------------------------------------------
+# Public API
+# -----------------------------------------------
+__all__: Final[tuple[str, ...]] = (
+    "ModelRecord",
+    "ModelRegistry",
+    "hash_data",
+)
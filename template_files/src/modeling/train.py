@@ -10,7 +10,21 @@ Train and evaluate machine learning models.
 from typing import Any
 
 
-def train_model(data: Any) -> Any:
+def train_model(
+    data: Any,
+    dataset: str = "default",
+    params: dict[str, Any] | None = None,
+) -> Any:
     print("Training model...")
     # TODO: Implement model training logic
-    return None
+    model: Any = None
+    metrics: dict[str, float] = {}
+
+    if model is not None:
+        # Deferred so importing this module does not load numpy
+        from .registry import ModelRegistry
+
+        _ = ModelRegistry().save(
+            model, dataset=dataset, params=params, data=data, metrics=metrics
+        )
+    return model
@@ -0,0 +1,433 @@
+# -----------------------------------------------------------------------------
+# File: src/shared/fetch.py
+# Description: Concurrent, resumable bulk downloader for external data
+# -----------------------------------------------------------------------------
+
+"""
+fetch.py
+~~~~~~~~
+
+Concurrent, resumable downloads of third-party data into `EXTERNAL_DIR`.
+
+A manifest lists each file's URL and, optionally, its expected SHA-256
+checksum and target filename. Files are fetched in parallel over a shared
+pool of keep-alive connections, streamed to disk in chunks, and resumed with
+an HTTP `Range` request if a previous run was interrupted. Files whose
+checksum already matches are skipped without touching the network.
+
+Usage:
+    >>> from shared.fetch import ManifestEntry, fetch_all
+    >>> manifest = [
+    ...     ManifestEntry(
+    ...         url="https://example.com/census.csv",
+    ...         sha256="9f86d081884c7d659a2feaa0c55ad015...",
+    ...     ),
+    ... ]
+    >>> results = fetch_all(manifest)
+
+    The manifest can also be stored as JSON (a list of objects with `url`,
+    `sha256` and `filename` keys) and loaded with `load_manifest()`.
+"""
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import hashlib
+import json
+from pathlib import Path
+import re
+from typing import Final, Literal
+from urllib.parse import unquote, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# -----------------------------------------------
+# Defaults
+# -----------------------------------------------
+DEFAULT_WORKERS: Final[int] = 8
+DEFAULT_CHUNK_SIZE: Final[int] = 1024 * 1024
+DEFAULT_TIMEOUT: Final[float] = 30.0
+PARTIAL_SUFFIX: Final[str] = ".part"
+VALIDATOR_SUFFIX: Final[str] = ".validator"
+CONTENT_RANGE_RE: Final[re.Pattern[str]] = re.compile(r"bytes (\d+)-\d+/")
+
+FetchStatus = Literal["skipped", "downloaded", "resumed"]
+
+
+# -----------------------------------------------
+# Manifest
+# -----------------------------------------------
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """
+    A single file to download.
+
+    Attributes:
+        url: Source URL of the file.
+        sha256: Expected hex SHA-256 digest. If omitted, an existing file is
+            always considered up to date and no verification is done.
+        filename: Target filename relative to the destination directory.
+            Defaults to the last path segment of the URL.
+    """
+
+    url: str
+    sha256: str | None = None
+    filename: str | None = None
+
+    @property
+    def target_name(self) -> str:
+        """Filename the entry is written to."""
+        if self.filename:
+            return self.filename
+        name = unquote(Path(urlparse(self.url).path).name)
+        if not name:
+            raise ValueError(f"Cannot derive a filename from URL: {self.url}")
+        return name
+
+
+@dataclass(frozen=True, slots=True)
+class FetchResult:
+    """
+    Outcome of fetching a single manifest entry.
+
+    Attributes:
+        entry: The manifest entry that was fetched.
+        path: Final location of the file on disk.
+        status: "skipped" if the file was already valid, "downloaded" for a
+            fresh download, or "resumed" if a partial file was continued.
+        bytes_written: Number of bytes transferred during this run.
+    """
+
+    entry: ManifestEntry
+    path: Path
+    status: FetchStatus
+    bytes_written: int
+
+
+def load_manifest(path: str | Path) -> list[ManifestEntry]:
+    """
+    Load a JSON manifest file.
+
+    The file must contain a list of objects, each with a `url` key and
+    optional `sha256` and `filename` keys.
+
+    Args:
+        path: Path to the JSON manifest.
+
+    Returns:
+        List of manifest entries in file order.
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        raw = json.load(f)
+
+    return [
+        ManifestEntry(
+            url=item["url"],
+            sha256=item.get("sha256"),
+            filename=item.get("filename"),
+        )
+        for item in raw
+    ]
+
+
+# -----------------------------------------------
+# Helpers
+# -----------------------------------------------
+def file_sha256(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Compute the hex SHA-256 digest of a file without loading it into memory.
+
+    Args:
+        path: File to hash.
+        chunk_size: Number of bytes read per iteration.
+
+    Returns:
+        Lowercase hex digest.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_current(path: Path, sha256: str | None) -> bool:
+    """Return True if `path` exists and matches the expected checksum."""
+    if not path.is_file():
+        return False
+    if sha256 is None:
+        return True
+    return file_sha256(path) == sha256.lower()
+
+
+def build_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """
+    Create a session whose connection pool can serve `pool_size` threads.
+
+    Args:
+        pool_size: Maximum number of pooled keep-alive connections per host.
+
+    Returns:
+        A configured `requests.Session`.
+    """
+    session = requests.Session()
+    # Byte offsets for `Range` must match the bytes written to disk, so
+    # ask servers not to apply a Content-Encoding such as gzip.
+    session.headers["Accept-Encoding"] = "identity"
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# -----------------------------------------------
+# Download Logic
+# -----------------------------------------------
+def _partial_paths(target: Path) -> tuple[Path, Path]:
+    """Return the `.part` data file and its validator sidecar."""
+    partial = target.with_name(target.name + PARTIAL_SUFFIX)
+    return partial, partial.with_name(partial.name + VALIDATOR_SUFFIX)
+
+
+def _response_validator(response: requests.Response) -> str | None:
+    """
+    Return a validator usable in an `If-Range` header.
+
+    Weak ETags are not allowed in `If-Range`, so `Last-Modified` is used
+    instead when the ETag is weak or missing.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _content_range_start(response: requests.Response) -> int | None:
+    """Parse the first byte position from a `Content-Range` header."""
+    match = CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+    return int(match.group(1)) if match else None
+
+
+def resolve_target(dest_dir: Path, entry: ManifestEntry) -> Path:
+    """
+    Resolve the file an entry is written to, confined to `dest_dir`.
+
+    Args:
+        dest_dir: Destination directory.
+        entry: Manifest entry.
+
+    Returns:
+        Absolute target path.
+
+    Raises:
+        ValueError: If the target would land outside `dest_dir`, e.g.
+            because of `..` segments or an absolute `filename`.
+    """
+    root = dest_dir.resolve()
+    target = (root / entry.target_name).resolve()
+    if target == root or not target.is_relative_to(root):
+        raise ValueError(
+            f"Target {entry.target_name!r} escapes destination {root}"
+        )
+    return target
+
+
+def _discard_partial(partial: Path, validator_path: Path) -> None:
+    partial.unlink(missing_ok=True)
+    validator_path.unlink(missing_ok=True)
+
+
+def fetch_one(
+    entry: ManifestEntry,
+    dest_dir: Path,
+    session: requests.Session,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> FetchResult:
+    """
+    Download a single manifest entry, resuming a partial file if present.
+
+    Data is streamed to `<filename>.part` and renamed into place only after
+    the checksum (if any) has been verified, so an interrupted run never
+    leaves a truncated file under the final name.
+
+    A partial file is only resumed when the server's `ETag` or
+    `Last-Modified` from the original response was recorded. It is sent
+    back as `If-Range`, so a server whose file has changed replies with the
+    full body instead of a range, and a `Content-Range` that does not start
+    at the partial file's size causes a fresh download.
+
+    Args:
+        entry: The file to fetch.
+        dest_dir: Directory the file is written to.
+        session: Shared HTTP session.
+        chunk_size: Number of bytes written per iteration.
+        timeout: Connect/read timeout in seconds.
+
+    Returns:
+        A `FetchResult` describing what was done.
+
+    Raises:
+        requests.HTTPError: If the server responds with an error status.
+        ValueError: If the downloaded file fails checksum verification, or
+            its target lies outside `dest_dir`.
+    """
+    target = resolve_target(dest_dir, entry)
+    if _is_current(target, entry.sha256):
+        return FetchResult(entry, target, "skipped", 0)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial, validator_path = _partial_paths(target)
+    validator = (
+        validator_path.read_text(encoding="utf-8")
+        if validator_path.is_file()
+        else None
+    )
+    offset = partial.stat().st_size if partial.exists() else 0
+    if offset and validator is None:
+        # Without a validator a changed remote file cannot be detected.
+        _discard_partial(partial, validator_path)
+        offset = 0
+
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers.update({"Range": f"bytes={offset}-", "If-Range": validator})
+
+    with session.get(
+        entry.url, headers=headers, stream=True, timeout=timeout
+    ) as response:
+        if offset and response.status_code == 416:
+            # The range starts at or past the end. The partial file may be
+            # complete, but only a checksum can confirm it.
+            if entry.sha256 is None or not _is_current(partial, entry.sha256):
+                _discard_partial(partial, validator_path)
+                return fetch_one(entry, dest_dir, session, chunk_size, timeout)
+            written = 0
+        else:
+            response.raise_for_status()
+            if offset and response.status_code == 206:
+                if _content_range_start(response) != offset:
+                    _discard_partial(partial, validator_path)
+                    return fetch_one(
+                        entry, dest_dir, session, chunk_size, timeout
+                    )
+            else:
+                # Fresh download, or the server ignored the range because
+                # the file changed: start over and record its validator.
+                offset = 0
+                new_validator = _response_validator(response)
+                if new_validator is not None:
+                    validator_path.write_text(new_validator, encoding="utf-8")
+                else:
+                    validator_path.unlink(missing_ok=True)
+
+            mode = "ab" if offset else "wb"
+            written = 0
+            with partial.open(mode) as f:
+                # Write the bytes exactly as sent, so the partial size stays
+                # aligned with the server's range offsets even if it applied
+                # a Content-Encoding anyway.
+                for chunk in response.raw.stream(
+                    chunk_size, decode_content=False
+                ):
+                    f.write(chunk)
+                    written += len(chunk)
+
+    if entry.sha256 is not None:
+        actual = file_sha256(partial)
+        if actual != entry.sha256.lower():
+            _discard_partial(partial, validator_path)
+            raise ValueError(
+                f"Checksum mismatch for {entry.url}: "
+                f"expected {entry.sha256}, got {actual}"
+            )
+
+    partial.replace(target)
+    validator_path.unlink(missing_ok=True)
+    status: FetchStatus = "resumed" if offset else "downloaded"
+    return FetchResult(entry, target, status, written)
+
+
+def fetch_all(
+    manifest: Iterable[ManifestEntry],
+    dest_dir: str | Path | None = None,
+    max_workers: int = DEFAULT_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[FetchResult]:
+    """
+    Download every manifest entry concurrently.
+
+    Args:
+        manifest: Entries to fetch.
+        dest_dir: Destination directory. Defaults to `EXTERNAL_DIR`.
+        max_workers: Number of concurrent downloads.
+        chunk_size: Number of bytes written per iteration.
+        timeout: Connect/read timeout in seconds.
+
+    Returns:
+        Results in manifest order.
+
+    Raises:
+        ValueError: If two entries resolve to the same target file, or a
+            target lies outside `dest_dir`.
+        Exception: The first error raised by any download, after all other
+            downloads have finished.
+    """
+    if dest_dir is None:
+        from shared.paths import EXTERNAL_DIR
+
+        dest_dir = EXTERNAL_DIR
+
+    entries: Sequence[ManifestEntry] = list(manifest)
+    target_dir = Path(dest_dir)
+
+    # Entries sharing a target would race on the same `.part` file
+    seen: set[Path] = set()
+    for entry in entries:
+        target = resolve_target(target_dir, entry)
+        if target in seen:
+            raise ValueError(
+                f"Duplicate target {entry.target_name!r} in manifest"
+            )
+        seen.add(target)
+
+    results: list[FetchResult | None] = [None] * len(entries)
+    errors: list[BaseException] = []
+
+    with (
+        build_session(pool_size=max_workers) as session,
+        ThreadPoolExecutor(max_workers=max_workers) as pool,
+    ):
+        futures = {
+            pool.submit(
+                fetch_one, entry, target_dir, session, chunk_size, timeout
+            ): index
+            for index, entry in enumerate(entries)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:  # noqa: BLE001 - re-raised below
+                errors.append(exc)
+
+    if errors:
+        raise errors[0]
+
+    return [result for result in results if result is not None]
+
+
+# -----------------------------------------------
+# Public API
+# -----------------------------------------------
+__all__: Final[tuple[str, ...]] = (
+    "ManifestEntry",
+    "FetchResult",
+    "load_manifest",
+    "file_sha256",
+    "build_session",
+    "resolve_target",
+    "fetch_one",
+    "fetch_all",
+)
@@ -0,0 +1,460 @@
+# -----------------------------------------------------------------------------
+# File: src/shared/notebooks.py
+# Description: Incremental Jupytext sync and parallel notebook execution
+# -----------------------------------------------------------------------------
+
+"""
+notebooks.py
+~~~~~~~~~~~~
+
+Incremental Jupytext sync and parallel execution for `notebooks/`.
+
+Each `.ipynb` notebook is paired with a `py:percent` script through
+Jupytext. Instead of syncing and re-running every notebook, this module
+records the content hash of both sides of each pair and only calls
+`jupytext --sync` on pairs whose hashes diverge from the last run.
+
+Execution is cached per notebook. The key hashes every code cell source
+together with a fingerprint (paths, sizes, mtimes) of the notebook's
+upstream inputs. On a cache hit the notebook is not executed and its
+outputs are restored; otherwise it runs in its own kernel, in parallel with
+the other stale notebooks. Pairs are synced before anything is executed,
+so an edit made on the script side is what runs and is never overwritten
+by the rewritten `.ipynb`.
+
+Inputs are declared per notebook in its metadata, as paths relative to the
+project root:
+
+    "metadata": {"pipeline": {"inputs": ["data/01_raw/sales.csv"]}}
+
+Notebooks without declared inputs depend on `EXTERNAL_DIR` and `RAW_DIR`.
+Cleaned and processed data are excluded by default because notebooks
+usually write them, which would otherwise invalidate every cache.
+
+Limitation: a changed notebook is re-executed from the first cell. Cached
+outputs do not restore kernel state, so an unchanged prefix of cells cannot
+be skipped safely.
+
+State lives under `CACHE_DIR / "notebooks"`.
+
+Usage:
+    >>> from shared.notebooks import sync_notebooks, run_notebooks
+    >>> sync_notebooks()
+    >>> run_notebooks(max_workers=4)
+
+    Or from the command line:
+        python src/shared/notebooks.py
+"""
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+import subprocess
+from typing import Final
+
+from jupytext.paired_paths import paired_paths
+import nbformat
+
+from shared.paths import (
+    BASE_DIR,
+    CACHE_DIR,
+    EXTERNAL_DIR,
+    NOTEBOOKS_DIR,
+    RAW_DIR,
+)
+
+# -----------------------------------------------
+# Defaults
+# -----------------------------------------------
+# Pairing used by `just nb-pair` when a notebook carries no formats metadata
+DEFAULT_FORMATS: Final[str] = "ipynb,/_scripts//py:percent"
+# Upstream inputs assumed for notebooks that declare none
+DEFAULT_INPUTS: Final[tuple[Path, ...]] = (EXTERNAL_DIR, RAW_DIR)
+DEFAULT_TIMEOUT: Final[int] = 600
+
+NOTEBOOK_CACHE_DIR: Final[Path] = CACHE_DIR / "notebooks"
+OUTPUT_CACHE_DIR: Final[Path] = NOTEBOOK_CACHE_DIR / "outputs"
+SYNC_STATE_PATH: Final[Path] = NOTEBOOK_CACHE_DIR / "sync_state.json"
+
+
+# -----------------------------------------------
+# Hashing Helpers
+# -----------------------------------------------
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_hash(path: Path) -> str | None:
+    """Return the SHA-256 digest of a file, or None if it does not exist."""
+    return _sha256_bytes(path.read_bytes()) if path.is_file() else None
+
+
+def data_fingerprint(inputs: Iterable[Path]) -> str:
+    """
+    Fingerprint input files by path, size and modification time.
+
+    Directories are walked recursively. File contents are not read, so
+    this stays cheap for large datasets.
+
+    Args:
+        inputs: Files or directories a notebook reads.
+
+    Returns:
+        Hex digest that changes whenever an input is added, removed or
+        touched.
+    """
+    digest = hashlib.sha256()
+    for input_path in sorted(inputs):
+        if input_path.is_file():
+            files = [input_path]
+        elif input_path.is_dir():
+            files = sorted(p for p in input_path.rglob("*") if p.is_file())
+        else:
+            digest.update(f"{input_path}\0missing\n".encode())
+            continue
+        for path in files:
+            stat = path.stat()
+            digest.update(
+                f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+            )
+    return digest.hexdigest()
+
+
+def notebook_inputs(
+    notebook: nbformat.NotebookNode,
+    default_inputs: Iterable[Path] = DEFAULT_INPUTS,
+) -> list[Path]:
+    """
+    Return the upstream inputs declared in a notebook's metadata.
+
+    Args:
+        notebook: Notebook to inspect.
+        default_inputs: Inputs used when the notebook declares none.
+
+    Returns:
+        Absolute input paths.
+    """
+    declared = notebook.metadata.get("pipeline", {}).get("inputs")
+    if not declared:
+        return list(default_inputs)
+    return [BASE_DIR / path for path in declared]
+
+
+def notebook_key(
+    notebook: nbformat.NotebookNode,
+    default_inputs: Iterable[Path] = DEFAULT_INPUTS,
+) -> str:
+    """
+    Compute the cache key of a notebook.
+
+    Args:
+        notebook: Notebook to key.
+        default_inputs: Inputs used when the notebook declares none.
+
+    Returns:
+        Hex digest of the code cell sources and the input fingerprint.
+    """
+    digest = hashlib.sha256(
+        data_fingerprint(notebook_inputs(notebook, default_inputs)).encode()
+    )
+    for cell in notebook.cells:
+        if cell.cell_type == "code":
+            digest.update(f"\0{cell.source}".encode())
+    return digest.hexdigest()
+
+
+# -----------------------------------------------
+# Pair Discovery & Sync
+# -----------------------------------------------
+def find_notebooks(notebook_dir: Path = NOTEBOOKS_DIR) -> list[Path]:
+    """
+    List all notebooks below `notebook_dir`, ignoring checkpoints.
+
+    Args:
+        notebook_dir: Root directory to search.
+
+    Returns:
+        Sorted list of `.ipynb` paths.
+    """
+    return sorted(
+        path
+        for path in notebook_dir.rglob("*.ipynb")
+        if ".ipynb_checkpoints" not in path.parts
+    )
+
+
+def _pairing_formats(notebook_path: Path) -> str | None:
+    """Return the Jupytext formats stored in a notebook, if it is paired."""
+    metadata = nbformat.read(notebook_path, as_version=4).metadata
+    return metadata.get("jupytext", {}).get("formats")
+
+
+def paired_script(notebook_path: Path) -> Path:
+    """
+    Resolve the `py:percent` script paired with a notebook.
+
+    Uses the formats stored in the notebook's Jupytext metadata and falls
+    back to `DEFAULT_FORMATS`.
+
+    Args:
+        notebook_path: Path to the `.ipynb` file.
+
+    Returns:
+        Path of the paired `.py` script.
+    """
+    formats = _pairing_formats(notebook_path) or DEFAULT_FORMATS
+
+    for path, fmt in paired_paths(str(notebook_path), "ipynb", formats):
+        if fmt.get("extension") == ".py":
+            return Path(os.path.normpath(path))
+
+    raise ValueError(f"No py script paired with notebook: {notebook_path}")
+
+
+def _load_state() -> dict[str, dict[str, str | None]]:
+    if not SYNC_STATE_PATH.is_file():
+        return {}
+    return json.loads(SYNC_STATE_PATH.read_text(encoding="utf-8"))
+
+
+def _save_state(state: dict[str, dict[str, str | None]]) -> None:
+    SYNC_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SYNC_STATE_PATH.write_text(
+        json.dumps(state, indent=2, sort_keys=True), encoding="utf-8"
+    )
+
+
+def _record_pair(
+    state: dict[str, dict[str, str | None]], notebook_path: Path
+) -> None:
+    state[str(notebook_path)] = {
+        "ipynb": _file_hash(notebook_path),
+        "script": _file_hash(paired_script(notebook_path)),
+    }
+
+
+def _record_rewrite(
+    state: dict[str, dict[str, str | None]],
+    notebook_path: Path,
+    previous: str | None,
+) -> None:
+    """
+    Record the new `.ipynb` hash after this module rewrote the notebook.
+
+    Only the notebook side is updated, and only if it was in sync before
+    the rewrite. The script side is never recorded here, so an unsynced
+    script edit still shows up as a divergence on the next sync.
+    """
+    entry = state.get(str(notebook_path))
+    if entry is not None and entry.get("ipynb") == previous:
+        entry["ipynb"] = _file_hash(notebook_path)
+
+
+def sync_notebooks(notebooks: Sequence[Path] | None = None) -> list[Path]:
+    """
+    Run `jupytext --sync` on pairs that changed since the last sync.
+
+    A pair is synced when either side's hash differs from the recorded
+    state, or when the paired script does not exist yet. Notebooks without
+    pairing metadata are paired using `DEFAULT_FORMATS`.
+
+    Args:
+        notebooks: Notebooks to consider. Defaults to all of `notebooks/`.
+
+    Returns:
+        The notebooks that were synced.
+    """
+    notebook_paths = list(notebooks) if notebooks else find_notebooks()
+    state = _load_state()
+    synced: list[Path] = []
+
+    for notebook_path in notebook_paths:
+        script_path = paired_script(notebook_path)
+        current = {
+            "ipynb": _file_hash(notebook_path),
+            "script": _file_hash(script_path),
+        }
+        if (
+            current["script"] is not None
+            and state.get(str(notebook_path)) == current
+        ):
+            continue
+
+        command = ["jupytext", "--sync", str(notebook_path)]
+        if _pairing_formats(notebook_path) is None:
+            command[1:1] = ["--set-formats", DEFAULT_FORMATS]
+
+        print(f"🔄 Syncing {notebook_path.name}...")
+        _ = subprocess.run(command, check=True)
+        _record_pair(state, notebook_path)
+        synced.append(notebook_path)
+
+    _save_state(state)
+    return synced
+
+
+# -----------------------------------------------
+# Output Cache
+# -----------------------------------------------
+def _cache_path(key: str) -> Path:
+    return OUTPUT_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def _write_cached(key: str, notebook: nbformat.NotebookNode) -> None:
+    path = _cache_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = [
+        {
+            "outputs": cell.get("outputs", []),
+            "execution_count": cell.get("execution_count"),
+        }
+        for cell in notebook.cells
+        if cell.cell_type == "code"
+    ]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _restore_outputs(notebook: nbformat.NotebookNode, key: str) -> bool:
+    """Restore cached outputs in place; return True if anything changed."""
+    cached = json.loads(_cache_path(key).read_text(encoding="utf-8"))
+    code_cells = [c for c in notebook.cells if c.cell_type == "code"]
+    changed = False
+    for cell, entry in zip(code_cells, cached, strict=True):
+        outputs = nbformat.from_dict(entry["outputs"])
+        if (
+            cell.get("outputs") != outputs
+            or cell.get("execution_count") != entry["execution_count"]
+        ):
+            cell.outputs = outputs
+            cell.execution_count = entry["execution_count"]
+            changed = True
+    return changed
+
+
+# -----------------------------------------------
+# Execution
+# -----------------------------------------------
+def execute_notebook(
+    notebook_path: Path, key: str, timeout: int = DEFAULT_TIMEOUT
+) -> str:
+    """
+    Execute a notebook in a fresh kernel and cache its outputs.
+
+    Runs in a worker process; imports of the execution engine are kept
+    local so the parent process does not pay for them.
+
+    Args:
+        notebook_path: Notebook to execute in place.
+        key: Cache key computed before execution.
+        timeout: Per-cell timeout in seconds.
+
+    Returns:
+        The notebook path as a string, for progress reporting.
+    """
+    from nbclient import NotebookClient
+
+    notebook = nbformat.read(notebook_path, as_version=4)
+    client = NotebookClient(
+        notebook,
+        timeout=timeout,
+        resources={"metadata": {"path": str(notebook_path.parent)}},
+    )
+    client.execute()
+
+    _write_cached(key, notebook)
+    nbformat.write(notebook, notebook_path)
+    return str(notebook_path)
+
+
+def run_notebooks(
+    notebooks: Sequence[Path] | None = None,
+    max_workers: int | None = None,
+    default_inputs: Iterable[Path] = DEFAULT_INPUTS,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> list[Path]:
+    """
+    Execute notebooks whose code or upstream inputs changed, in parallel.
+
+    Changed pairs are synced first. Cached notebooks are not executed;
+    their outputs are restored from the cache instead, and the file is
+    only rewritten if the restored outputs differ. Each remaining notebook
+    runs in its own worker process and kernel.
+
+    Args:
+        notebooks: Notebooks to consider. Defaults to all of `notebooks/`.
+        max_workers: Number of notebooks executed at once. Defaults to the
+            CPU count.
+        default_inputs: Inputs for notebooks that declare none.
+        timeout: Per-cell timeout in seconds.
+
+    Returns:
+        The notebooks that were executed.
+    """
+    notebook_paths = list(notebooks) if notebooks else find_notebooks()
+    # Execution rewrites the .ipynb, which would then look newer than an
+    # unsynced script edit and win the next `jupytext --sync`.
+    sync_notebooks(notebook_paths)
+    state = _load_state()
+    stale: dict[Path, str] = {}
+    previous: dict[Path, str | None] = {}
+
+    for notebook_path in notebook_paths:
+        notebook = nbformat.read(notebook_path, as_version=4)
+        key = notebook_key(notebook, default_inputs)
+        previous[notebook_path] = _file_hash(notebook_path)
+        if not _cache_path(key).is_file():
+            print(f"▶️  {notebook_path.name}: code or inputs changed")
+            stale[notebook_path] = key
+            continue
+
+        if _restore_outputs(notebook, key):
+            nbformat.write(notebook, notebook_path)
+            _record_rewrite(state, notebook_path, previous[notebook_path])
+        print(f"⏭️  {notebook_path.name}: up to date")
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(execute_notebook, path, key, timeout)
+                for path, key in stale.items()
+            ]
+            for future in futures:
+                print(f"✅ Executed {Path(future.result()).name}")
+
+    # Executing rewrites the .ipynb side; record it so the next sync
+    # does not treat the new outputs as a divergence.
+    for notebook_path in stale:
+        _record_rewrite(state, notebook_path, previous[notebook_path])
+    _save_state(state)
+
+    return list(stale)
+
+
+# -----------------------------------------------
+# Public API
+# -----------------------------------------------
+__all__: Final[tuple[str, ...]] = (
+    "find_notebooks",
+    "paired_script",
+    "data_fingerprint",
+    "notebook_inputs",
+    "notebook_key",
+    "sync_notebooks",
+    "execute_notebook",
+    "run_notebooks",
+)
+
+
+# -----------------------------------------------
+# Entrypoint
+# -----------------------------------------------
+def main() -> None:
+    """Entrypoint for script execution."""
+    run_notebooks()
+
+
+if __name__ == "__main__":
+    main()
@@ -71,8 +71,10 @@ BASE_DIR: Final[Path] = find_project_root()
 SRC_DIR: Final[Path] = BASE_DIR / "src"
 DATA_DIR: Final[Path] = BASE_DIR / "data"
 RESULTS_DIR: Final[Path] = BASE_DIR / "results"
+MODELS_DIR: Final[Path] = BASE_DIR / "models"
 REFERENCE_DIR: Final[Path] = BASE_DIR / "references"
 DOCS_DIR: Final[Path] = BASE_DIR / "docs"
+NOTEBOOKS_DIR: Final[Path] = BASE_DIR / "notebooks"
 TESTS_DIR: Final[Path] = BASE_DIR / "tests"
 
 # -----------------------------------------------
@@ -111,10 +113,13 @@ __all__: Final[tuple[str, ...]] = (
     "SRC_DIR",
     "DATA_DIR",
     "RESULTS_DIR",
+    "MODELS_DIR",
     "REFERENCE_DIR",
     "DOCS_DIR",
+    "NOTEBOOKS_DIR",
     "TESTS_DIR",
     # Primary Data Directories
+    "EXTERNAL_DIR",
     "RAW_DIR",
     "RAW_GEOENTITY_DIR",
     "CLEANED_DIR",
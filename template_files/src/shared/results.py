@@ -0,0 +1,291 @@
+# -----------------------------------------------------------------------------
+# File: src/shared/results.py
+# Description: Collect result tables and export them to Excel or Parquet
+# -----------------------------------------------------------------------------
+
+"""
+results.py
+~~~~~~~~~~
+
+Bulk export of result tables to `RESULTS_DIR`.
+
+Report scripts often produce many small tables. Writing each one with its
+own `to_excel` call reopens and rewrites the workbook every time. A
+`ResultsWriter` instead collects tables in memory and writes them in a
+single pass, either as one workbook with one sheet per table or as one
+Parquet dataset with one partition per table.
+
+Both exports support an append mode that keeps earlier results in place:
+new sheets are added next to existing ones, and new Parquet files are added
+to the existing partitions. Replacing a Parquet dataset only ever deletes
+the dataset's own partitions; a directory holding anything else is
+refused.
+
+Usage:
+    >>> from shared.results import ResultsWriter
+    >>> results = ResultsWriter()
+    >>> results.add("summary_table", summary_df)
+    >>> results.add("by_region", region_df, index=True)
+    >>> results.write_excel(RESULTS_DIR / "summary_table.xlsx")
+    >>> results.write_parquet(RESULTS_DIR / "summary", append=True)
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+import re
+from typing import Any, Final
+from uuid import uuid4
+
+import pandas as pd
+
+# -----------------------------------------------
+# Defaults
+# -----------------------------------------------
+EXCEL_SHEET_NAME_LIMIT: Final[int] = 31
+INVALID_SHEET_CHARS: Final[re.Pattern[str]] = re.compile(r"[\[\]:*?/\\]")
+PARTITION_COLUMN: Final[str] = "table"
+INVALID_PARTITION_CHARS: Final[re.Pattern[str]] = re.compile(r"[/\\=]")
+PART_FILE_RE: Final[re.Pattern[str]] = re.compile(
+    r"part-[0-9a-f]{32}-\d{5}\.parquet"
+)
+
+
+# -----------------------------------------------
+# Records
+# -----------------------------------------------
+class TableRecord:
+    """
+    A named result table waiting to be written.
+
+    Attributes:
+        name: Sheet name (Excel) or partition value (Parquet).
+        frame: The table contents.
+        index: Whether to write the DataFrame index as leading columns.
+    """
+
+    __slots__ = ("name", "frame", "index")
+
+    def __init__(self, name: str, frame: pd.DataFrame, index: bool = False):
+        self.name = name
+        self.frame = frame
+        self.index = index
+
+    def __repr__(self) -> str:
+        rows, cols = self.frame.shape
+        return f"TableRecord(name={self.name!r}, shape=({rows}, {cols}))"
+
+    def header(self) -> list[str]:
+        """Column labels as written, including index names if requested."""
+        labels: list[Any] = list(self.frame.columns)
+        if self.index:
+            labels = [
+                name if name is not None else f"level_{i}"
+                for i, name in enumerate(self.frame.index.names)
+            ] + labels
+        return [
+            " / ".join(map(str, label))
+            if isinstance(label, tuple)
+            else str(label)
+            for label in labels
+        ]
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Yield table rows with missing values converted to None."""
+        frame = self.frame.astype(object).where(self.frame.notna(), None)
+        for row in frame.itertuples(index=self.index, name=None):
+            if self.index and isinstance(row[0], tuple):
+                yield (*row[0], *row[1:])
+            else:
+                yield row
+
+
+# -----------------------------------------------
+# Helpers
+# -----------------------------------------------
+def _sheet_title(name: str, taken: set[str]) -> str:
+    """
+    Make a valid, unique Excel sheet title from an arbitrary table name.
+
+    Args:
+        name: Requested table name.
+        taken: Titles already present in the workbook (case-insensitive).
+
+    Returns:
+        A title of at most 31 characters that is not in `taken`.
+    """
+    base = INVALID_SHEET_CHARS.sub("_", name).strip("'") or "Sheet"
+    title = base[:EXCEL_SHEET_NAME_LIMIT]
+    counter = 1
+    while title.lower() in taken:
+        suffix = f"_{counter}"
+        title = base[: EXCEL_SHEET_NAME_LIMIT - len(suffix)] + suffix
+        counter += 1
+    taken.add(title.lower())
+    return title
+
+
+def _clear_dataset(root: Path) -> None:
+    """
+    Delete the partitions of a dataset previously written by this module.
+
+    Everything below `root` is checked before anything is removed, so a
+    mistyped path never loses unrelated files.
+
+    Args:
+        root: Dataset root directory.
+
+    Raises:
+        ValueError: If `root` is not a directory, or contains anything
+            other than `table=*` partitions holding part files.
+    """
+    if not root.is_dir():
+        raise ValueError(f"Not a Parquet dataset directory: {root}")
+
+    partitions = list(root.iterdir())
+    for partition in partitions:
+        foreign = (
+            not partition.is_dir()
+            or partition.is_symlink()
+            or not partition.name.startswith(f"{PARTITION_COLUMN}=")
+            or any(
+                not (f.is_file() and PART_FILE_RE.fullmatch(f.name))
+                for f in partition.iterdir()
+            )
+        )
+        if foreign:
+            raise ValueError(
+                f"Refusing to replace {root}: {partition.name!r} is not part "
+                "of a results dataset"
+            )
+
+    for partition in partitions:
+        for part in partition.iterdir():
+            part.unlink()
+        partition.rmdir()
+
+
+# -----------------------------------------------
+# Writer
+# -----------------------------------------------
+class ResultsWriter:
+    """
+    Collect result tables and export them in bulk.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self) -> None:
+        self._records: list[TableRecord] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[TableRecord]:
+        return iter(self._records)
+
+    def add(self, name: str, frame: pd.DataFrame, index: bool = False) -> None:
+        """
+        Queue a table for export.
+
+        Args:
+            name: Sheet name (Excel) or partition value (Parquet).
+            frame: Table contents. The DataFrame is not copied.
+            index: Whether to write the DataFrame index as leading columns.
+        """
+        self._records.append(TableRecord(name, frame, index))
+
+    def clear(self) -> None:
+        """Drop all queued tables."""
+        self._records.clear()
+
+    def write_excel(self, path: str | Path, append: bool = False) -> Path:
+        """
+        Write every queued table to one workbook, one sheet per table.
+
+        A new workbook is streamed with openpyxl's write-only mode, so rows
+        are never held as cell objects in memory. In append mode the
+        existing workbook is opened once and the new sheets are added after
+        the existing ones; clashing names receive a numeric suffix.
+
+        Appending is not streamed: openpyxl loads the whole workbook into
+        memory and cannot round-trip charts or images, which are dropped
+        on save. Append only to workbooks produced by this writer.
+
+        Args:
+            path: Destination `.xlsx` file.
+            append: Keep existing sheets if the workbook already exists.
+
+        Returns:
+            The path written to.
+        """
+        from openpyxl import Workbook, load_workbook
+
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        if append and target.exists():
+            workbook = load_workbook(target)
+        else:
+            workbook = Workbook(write_only=True)
+
+        taken = {title.lower() for title in workbook.sheetnames}
+        for record in self._records:
+            sheet = workbook.create_sheet(_sheet_title(record.name, taken))
+            sheet.append(record.header())
+            for row in record.rows():
+                sheet.append(row)
+
+        workbook.save(target)
+        return target
+
+    def write_parquet(self, path: str | Path, append: bool = False) -> Path:
+        """
+        Write every queued table to one Parquet dataset.
+
+        Each table is written to its own file under the hive-style
+        partition `table=<name>/`, so tables with different schemas can
+        share a dataset and be read back individually with
+        `pd.read_parquet(path / "table=<name>")`.
+
+        Args:
+            path: Dataset root directory.
+            append: Keep existing files and add new files per partition.
+                Otherwise the dataset's existing partitions are removed.
+
+        Returns:
+            The dataset root.
+
+        Raises:
+            ValueError: If replacing and `path` exists but holds anything
+                other than partitions written by this method.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        root = Path(path)
+        if not append and root.exists():
+            _clear_dataset(root)
+
+        run_id = uuid4().hex
+        for counter, record in enumerate(self._records):
+            frame = record.frame.reset_index() if record.index else record.frame
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            value = INVALID_PARTITION_CHARS.sub("_", record.name)
+            partition = root / f"{PARTITION_COLUMN}={value}"
+            partition.mkdir(parents=True, exist_ok=True)
+            # One file per record, so tables whose names collide after
+            # sanitizing land in the same partition without overwriting
+            pq.write_table(
+                table, partition / f"part-{run_id}-{counter:05d}.parquet"
+            )
+
+        return root
+
+
+# -----------------------------------------------
+# Public API
+# -----------------------------------------------
+__all__: Final[tuple[str, ...]] = (
+    "TableRecord",
+    "ResultsWriter",
+)
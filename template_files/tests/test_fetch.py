@@ -0,0 +1,236 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/tests/test_fetch.py
+# Description: Tests for the external data fetcher against a local server
+# -----------------------------------------------------------------------------
+
+"""
+Exercise `shared.fetch` against a local `http.server` that understands
+`Range`, `If-Range` and `ETag`, so downloads, resumes and checksum skips
+can be tested without network access.
+"""
+
+from collections.abc import Iterator
+import gzip
+import hashlib
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+import pytest
+
+from shared.fetch import ManifestEntry, fetch_all
+
+PAYLOAD: bytes = bytes(range(256)) * 4096
+
+
+def _etag(data: bytes) -> str:
+    return f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serve files with single-range `Range` and `If-Range` support."""
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(404)
+            return
+
+        data = path.read_bytes()
+        etag = _etag(data)
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and if_range not in (None, etag):
+            range_header = None
+
+        start = 0
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+
+        body = data[start:]
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class GzipRangeRequestHandler(RangeRequestHandler):
+    """Gzip the whole body whenever the client accepts it, like many CDNs."""
+
+    def do_GET(self) -> None:
+        if "gzip" not in self.headers.get("Accept-Encoding", ""):
+            super().do_GET()
+            return
+
+        path = Path(self.translate_path(self.path))
+        data = path.read_bytes()
+        body = gzip.compress(data)
+        self.send_response(200)
+        self.send_header("ETag", _etag(data))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _serve(directory: Path, handler_class: type) -> Iterator[str]:
+    def handler(*args: object, **kwargs: object) -> RangeRequestHandler:
+        return handler_class(*args, directory=str(directory), **kwargs)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "remote"
+    directory.mkdir()
+    (directory / "data.bin").write_bytes(PAYLOAD)
+    return directory
+
+
+@pytest.fixture
+def base_url(server_dir: Path) -> Iterator[str]:
+    yield from _serve(server_dir, RangeRequestHandler)
+
+
+@pytest.fixture
+def gzip_url(server_dir: Path) -> Iterator[str]:
+    yield from _serve(server_dir, GzipRangeRequestHandler)
+
+
+@pytest.fixture
+def entry(base_url: str) -> ManifestEntry:
+    return ManifestEntry(
+        url=f"{base_url}/data.bin",
+        sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+
+def test_fresh_download(entry: ManifestEntry, tmp_path: Path) -> None:
+    dest = tmp_path / "external"
+    [result] = fetch_all([entry], dest)
+
+    assert result.status == "downloaded"
+    assert (dest / "data.bin").read_bytes() == PAYLOAD
+    assert not list(dest.glob("*.part*"))
+
+
+def test_resume_partial_download(entry: ManifestEntry, tmp_path: Path) -> None:
+    dest = tmp_path / "external"
+    dest.mkdir()
+    (dest / "data.bin.part").write_bytes(PAYLOAD[:1000])
+    (dest / "data.bin.part.validator").write_text(_etag(PAYLOAD))
+
+    [result] = fetch_all([entry], dest)
+
+    assert result.status == "resumed"
+    assert result.bytes_written == len(PAYLOAD) - 1000
+    assert (dest / "data.bin").read_bytes() == PAYLOAD
+
+
+def test_resume_restarts_when_remote_changed(
+    entry: ManifestEntry, tmp_path: Path
+) -> None:
+    dest = tmp_path / "external"
+    dest.mkdir()
+    (dest / "data.bin.part").write_bytes(b"stale bytes")
+    (dest / "data.bin.part.validator").write_text('"outdated"')
+
+    [result] = fetch_all([entry], dest)
+
+    assert result.status == "downloaded"
+    assert (dest / "data.bin").read_bytes() == PAYLOAD
+
+
+def test_skip_when_checksum_matches(
+    entry: ManifestEntry, tmp_path: Path
+) -> None:
+    dest = tmp_path / "external"
+    dest.mkdir()
+    (dest / "data.bin").write_bytes(PAYLOAD)
+
+    [result] = fetch_all([entry], dest)
+
+    assert result.status == "skipped"
+    assert result.bytes_written == 0
+
+
+def test_checksum_mismatch_raises(base_url: str, tmp_path: Path) -> None:
+    dest = tmp_path / "external"
+    bad = ManifestEntry(url=f"{base_url}/data.bin", sha256="0" * 64)
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        fetch_all([bad], dest)
+
+    assert not (dest / "data.bin").exists()
+    assert not list(dest.glob("*.part*"))
+
+
+def test_duplicate_targets_rejected(base_url: str, tmp_path: Path) -> None:
+    manifest = [
+        ManifestEntry(url=f"{base_url}/data.bin"),
+        ManifestEntry(url=f"{base_url}/other/data.bin"),
+    ]
+
+    with pytest.raises(ValueError, match="Duplicate target"):
+        fetch_all(manifest, tmp_path)
+
+
+def test_duplicate_targets_compare_resolved_paths(
+    base_url: str, tmp_path: Path
+) -> None:
+    manifest = [
+        ManifestEntry(url=f"{base_url}/data.bin", filename="data.bin"),
+        ManifestEntry(url=f"{base_url}/data.bin", filename="./sub/../data.bin"),
+    ]
+
+    with pytest.raises(ValueError, match="Duplicate target"):
+        fetch_all(manifest, tmp_path)
+
+
+@pytest.mark.parametrize("filename", ["../escaped.bin", "/tmp/escaped.bin"])
+def test_targets_outside_dest_dir_rejected(
+    base_url: str, tmp_path: Path, filename: str
+) -> None:
+    dest = tmp_path / "external"
+    bad = ManifestEntry(url=f"{base_url}/data.bin", filename=filename)
+
+    with pytest.raises(ValueError, match="escapes destination"):
+        fetch_all([bad], dest)
+
+    assert not (tmp_path / "escaped.bin").exists()
+
+
+def test_resume_against_gzip_server(gzip_url: str, tmp_path: Path) -> None:
+    dest = tmp_path / "external"
+    dest.mkdir()
+    (dest / "data.bin.part").write_bytes(PAYLOAD[:1000])
+    (dest / "data.bin.part.validator").write_text(_etag(PAYLOAD))
+    entry = ManifestEntry(
+        url=f"{gzip_url}/data.bin",
+        sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    [result] = fetch_all([entry], dest)
+
+    assert result.status == "resumed"
+    assert (dest / "data.bin").read_bytes() == PAYLOAD
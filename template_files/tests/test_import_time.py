@@ -0,0 +1,88 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/tests/test_import_time.py
+# Description: Import-time regression test for the src packages
+# -----------------------------------------------------------------------------
+
+"""
+Guard against slow startup of the project packages.
+
+Each module is imported in a fresh interpreter with `-X importtime`. The
+test fails if its cumulative import time exceeds the budget, or if it
+eagerly pulls in a heavy library that should only load on first use.
+"""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR: Path = Path(__file__).resolve().parents[1] / "src"
+BUDGET_MS: float = 100.0
+HEAVY_MODULES: frozenset[str] = frozenset(
+    {"pandas", "numpy", "matplotlib", "sklearn", "xgboost", "scipy"}
+)
+
+# Every module that should stay cheap to import. `modeling.registry`
+# needs numpy by design and is only reached lazily.
+MODULES: tuple[str, ...] = (
+    "src",
+    "src.modeling",
+    "config",
+    "dataset",
+    "features",
+    "plots",
+    "modeling",
+    "modeling.train",
+    "modeling.predict",
+)
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """
+    Import `module` in a fresh interpreter and parse `-X importtime` output.
+
+    Returns:
+        Cumulative import time of `module` in milliseconds, and the set of
+        top-level package names imported along the way.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(SRC_DIR), str(SRC_DIR.parent), env.get("PYTHONPATH", "")]
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    cumulative_us = 0
+    imported: set[str] = set()
+    for line in completed.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <name>"
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(fields[1])
+
+    return cumulative_us / 1000, imported
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_time_within_budget(module: str) -> None:
+    elapsed_ms, imported = measure_import(module)
+
+    assert not imported & HEAVY_MODULES, (
+        f"{module} eagerly imports {sorted(imported & HEAVY_MODULES)}"
+    )
+    assert elapsed_ms <= BUDGET_MS, (
+        f"{module} took {elapsed_ms:.1f} ms (budget {BUDGET_MS} ms)"
+    )
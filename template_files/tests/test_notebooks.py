@@ -0,0 +1,102 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/tests/test_notebooks.py
+# Description: Tests for incremental notebook sync and cached execution
+# -----------------------------------------------------------------------------
+
+"""
+Exercise `shared.notebooks` in a throwaway project: cache keys, the
+sync/skip decisions of `sync_notebooks`, and that `run_notebooks` never
+overwrites an edit made on the script side of a pair.
+"""
+
+import os
+from pathlib import Path
+
+import nbformat
+import pytest
+
+from shared import notebooks as nb
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / ".cache" / "notebooks"
+    monkeypatch.setattr(nb, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(nb, "OUTPUT_CACHE_DIR", cache_dir / "outputs")
+    monkeypatch.setattr(nb, "SYNC_STATE_PATH", cache_dir / "sync_state.json")
+    (tmp_path / "notebooks").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "input.csv").write_text("a\n1\n")
+    return tmp_path
+
+
+def _new_notebook(path: Path, *sources: str) -> Path:
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells = [nbformat.v4.new_code_cell(src) for src in sources]
+    notebook.metadata["pipeline"] = {"inputs": ["data/input.csv"]}
+    notebook.metadata["kernelspec"] = {
+        "name": "python3",
+        "display_name": "Python 3",
+        "language": "python",
+    }
+    nbformat.write(notebook, path)
+    return path
+
+
+def test_notebook_key_tracks_code_and_inputs(project: Path) -> None:
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells = [nbformat.v4.new_code_cell("x = 1")]
+    notebook.metadata["pipeline"] = {"inputs": ["data/input.csv"]}
+    key = nb.notebook_key(notebook)
+
+    notebook.cells.append(nbformat.v4.new_markdown_cell("# Notes"))
+    assert nb.notebook_key(notebook) == key
+
+    notebook.cells[0].source = "x = 2"
+    edited = nb.notebook_key(notebook)
+    assert edited != key
+
+    data = project / "data" / "input.csv"
+    stat = data.stat()
+    os.utime(data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert nb.notebook_key(notebook) != edited
+
+
+def test_sync_notebooks_skips_unchanged_pairs(project: Path) -> None:
+    path = _new_notebook(project / "notebooks" / "a.ipynb", "x = 1")
+    script = project / "notebooks" / "_scripts" / "a.py"
+
+    assert nb.sync_notebooks([path]) == [path]
+    assert script.is_file()
+    assert nb.sync_notebooks([path]) == []
+
+    script.write_text(script.read_text().replace("x = 1", "x = 2"))
+    assert nb.sync_notebooks([path]) == [path]
+    assert "x = 2" in nbformat.read(path, as_version=4).cells[0].source
+
+    script.unlink()
+    assert nb.sync_notebooks([path]) == [path]
+    assert script.is_file()
+
+
+def test_run_keeps_script_edit(project: Path) -> None:
+    path = _new_notebook(project / "notebooks" / "a.ipynb", "print(1)")
+    script = project / "notebooks" / "_scripts" / "a.py"
+
+    assert nb.run_notebooks([path], max_workers=1) == [path]
+    executed = path.read_bytes()
+
+    # Cache hit with identical outputs: the notebook is left untouched
+    assert nb.run_notebooks([path], max_workers=1) == []
+    assert path.read_bytes() == executed
+
+    # Edit the script without syncing, then run
+    script.write_text(script.read_text().replace("print(1)", "print(2)"))
+    assert nb.run_notebooks([path], max_workers=1) == [path]
+
+    [cell] = nbformat.read(path, as_version=4).cells
+    assert cell.source == "print(2)"
+    assert cell.outputs[0]["text"] == "2\n"
+
+    assert nb.sync_notebooks([path]) == []
+    assert "print(2)" in script.read_text()
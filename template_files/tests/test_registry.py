@@ -0,0 +1,102 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/tests/test_registry.py
+# Description: Tests for the content-addressed model registry
+# -----------------------------------------------------------------------------
+
+"""
+Exercise `modeling.registry.ModelRegistry` against a temporary root:
+deduplication, the latest pointer, history order, memory-mapped loads and
+the guarantees around unsafe array names and read-only lookups.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from modeling.registry import ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> ModelRegistry:
+    return ModelRegistry(tmp_path / "models")
+
+
+def _object_files(registry: ModelRegistry) -> list[Path]:
+    return list(registry.objects_dir.glob("??/*"))
+
+
+def test_identical_artifacts_stored_once(registry: ModelRegistry) -> None:
+    model = {"depth": 6, "weights": [0.1, 0.2]}
+    first = registry.save(model, dataset="sales")
+    second = registry.save(dict(model), dataset="sales")
+
+    assert first.hash == second.hash
+    assert first.id != second.id
+    assert len(_object_files(registry)) == 1
+    assert not list(registry.objects_dir.glob(".tmp-*"))
+    assert registry.load(second) == model
+
+
+def test_latest_switches_per_dataset(registry: ModelRegistry) -> None:
+    first = registry.save("model-a", dataset="sales")
+    other = registry.save("model-b", dataset="stock")
+    assert registry.latest("sales") == first
+
+    second = registry.save("model-c", dataset="sales")
+
+    assert registry.latest("sales") == second
+    assert registry.latest("stock") == other
+    assert registry.load_latest("sales") == "model-c"
+
+
+def test_history_newest_first(registry: ModelRegistry) -> None:
+    ids = [
+        registry.save(f"model-{i}", dataset="sales", metrics={"i": i}).id
+        for i in range(3)
+    ]
+    registry.save("other", dataset="stock")
+
+    history = registry.history("sales")
+
+    assert [record.id for record in history] == ids[::-1]
+    assert [record.metrics["i"] for record in history] == [2, 1, 0]
+
+
+def test_arrays_loaded_memory_mapped(registry: ModelRegistry) -> None:
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    weights = {"coef": array, "intercept": np.zeros(4)}
+
+    npy = registry.save(array, dataset="a")
+    npy_dir = registry.save(weights, dataset="b")
+
+    assert (npy.kind, npy_dir.kind) == ("npy", "npy_dir")
+    loaded = registry.load(npy)
+    assert isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, array)
+
+    loaded_dir = registry.load(npy_dir)
+    assert sorted(loaded_dir) == ["coef", "intercept"]
+    assert all(isinstance(v, np.memmap) for v in loaded_dir.values())
+    np.testing.assert_array_equal(loaded_dir["coef"], array)
+
+    assert not isinstance(registry.load(npy, mmap=False), np.memmap)
+
+
+@pytest.mark.parametrize("key", ["../escape", "a/b", ".hidden", ""])
+def test_unsafe_array_keys_rejected(registry: ModelRegistry, key: str) -> None:
+    with pytest.raises(ValueError, match="Array names"):
+        registry.save({key: np.zeros(2)}, dataset="sales")
+
+    assert not registry.root.exists()
+
+
+def test_lookups_on_fresh_root_create_nothing(registry: ModelRegistry) -> None:
+    assert registry.latest("sales") is None
+    assert registry.history("sales") == []
+    with pytest.raises(KeyError):
+        registry.get(1)
+    with pytest.raises(KeyError):
+        registry.load_latest("sales")
+
+    assert not registry.root.exists()
@@ -0,0 +1,132 @@
+# -----------------------------------------------------------------------------
+# File: ${PROJECT_PATH}/tests/test_results.py
+# Description: Tests for bulk Excel and Parquet export of result tables
+# -----------------------------------------------------------------------------
+
+"""
+Exercise `shared.results.ResultsWriter`: sheet naming, missing values,
+MultiIndex output, append mode for both formats, and the safety checks
+around replacing a Parquet dataset.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from openpyxl import load_workbook
+import pandas as pd
+import pytest
+
+from shared.results import ResultsWriter
+
+
+def _read_sheets(path: Path) -> dict[str, list[tuple[object, ...]]]:
+    workbook = load_workbook(path)
+    return {
+        sheet.title: list(sheet.iter_rows(values_only=True))
+        for sheet in workbook.worksheets
+    }
+
+
+def test_excel_sheet_names_sanitized_and_unique(tmp_path: Path) -> None:
+    frame = pd.DataFrame({"a": [1]})
+    results = ResultsWriter()
+    results.add("a/b:c", frame)
+    results.add("A_B_C", frame)
+    results.add("x" * 40, frame)
+    results.add("x" * 40, frame)
+
+    sheets = _read_sheets(results.write_excel(tmp_path / "out.xlsx"))
+
+    assert list(sheets) == ["a_b_c", "A_B_C_1", "x" * 31, "x" * 29 + "_1"]
+
+
+def test_excel_missing_values_written_as_empty(tmp_path: Path) -> None:
+    results = ResultsWriter()
+    results.add("t", pd.DataFrame({"a": [1.0, np.nan], "b": [None, "y"]}))
+
+    sheets = _read_sheets(results.write_excel(tmp_path / "out.xlsx"))
+
+    assert sheets["t"] == [("a", "b"), (1, None), (None, "y")]
+
+
+def test_excel_multiindex_written_as_leading_columns(tmp_path: Path) -> None:
+    index = pd.MultiIndex.from_tuples(
+        [("n", 1), ("s", 2)], names=["region", None]
+    )
+    results = ResultsWriter()
+    results.add("t", pd.DataFrame({"v": [10, 20]}, index=index), index=True)
+
+    sheets = _read_sheets(results.write_excel(tmp_path / "out.xlsx"))
+
+    assert sheets["t"] == [
+        ("region", "level_1", "v"),
+        ("n", 1, 10),
+        ("s", 2, 20),
+    ]
+
+
+def test_excel_append_keeps_existing_sheets(tmp_path: Path) -> None:
+    path = tmp_path / "out.xlsx"
+    first = ResultsWriter()
+    first.add("summary", pd.DataFrame({"a": [1]}))
+    first.write_excel(path)
+
+    second = ResultsWriter()
+    second.add("summary", pd.DataFrame({"a": [2]}))
+    second.write_excel(path, append=True)
+
+    sheets = _read_sheets(path)
+    assert sheets == {"summary": [("a",), (1,)], "summary_1": [("a",), (2,)]}
+
+
+def test_parquet_append_and_replace(tmp_path: Path) -> None:
+    root = tmp_path / "dataset"
+    results = ResultsWriter()
+    results.add("t", pd.DataFrame({"a": [1, 2]}))
+    results.write_parquet(root)
+    results.write_parquet(root, append=True)
+
+    assert len(list((root / "table=t").glob("*.parquet"))) == 2
+    assert pd.read_parquet(root / "table=t")["a"].tolist() == [1, 2, 1, 2]
+
+    results.write_parquet(root)
+
+    assert len(list((root / "table=t").glob("*.parquet"))) == 1
+    assert pd.read_parquet(root / "table=t")["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "foreign", ["notes.txt", "table=t/notes.txt", "other/part.parquet"]
+)
+def test_parquet_replace_refuses_foreign_files(
+    tmp_path: Path, foreign: str
+) -> None:
+    root = tmp_path / "dataset"
+    results = ResultsWriter()
+    results.add("t", pd.DataFrame({"a": [1]}))
+    results.write_parquet(root)
+    stray = root / foreign
+    stray.parent.mkdir(parents=True, exist_ok=True)
+    stray.write_text("keep me")
+
+    with pytest.raises(ValueError, match="Refusing to replace"):
+        results.write_parquet(root)
+
+    assert stray.read_text() == "keep me"
+    assert len(list((root / "table=t").glob("*.parquet"))) == 1
+
+
+def test_parquet_shared_partition_uses_first_schema(tmp_path: Path) -> None:
+    # "a/b" and "a=b" sanitize to the same partition. Reading it back
+    # unifies on the first file's schema, so the second table's `index`
+    # column is silently dropped; use distinct names to keep both.
+    results = ResultsWriter()
+    results.add("a/b", pd.DataFrame({"v": [1]}))
+    results.add("a=b", pd.DataFrame({"v": [2]}, index=[7]), index=True)
+    root = results.write_parquet(tmp_path / "dataset")
+
+    assert len(list((root / "table=a_b").glob("*.parquet"))) == 2
+    frame = pd.read_parquet(root / "table=a_b")
+
+    assert list(frame.columns) == ["v"]
+    assert frame["v"].tolist() == [1, 2]